@@ -2,7 +2,7 @@ import streamlit as st
 import pandas as pd
 from src.data_handler import DataHandler
 from src.agent import DroneAgent
-from src.logic import ConflictDetector
+from src.logic import ConflictDetector, TableQuery
 import os
 from dotenv import load_dotenv
 
@@ -87,18 +87,104 @@ sheet_mapping = {
     "drones": "Drone Fleet",
     "missions": "Missions",
 }
+# Minimum seconds between background re-pulls from Sheets
+SHEETS_REFRESH_SECONDS = 300
+
+
+# Cached across reruns: local CSVs are served immediately while the Sheets
+# connector / public sheet pulls warm up on a background thread.
+@st.cache_resource
+def get_data_handler():
+    return DataHandler(
+        pilot_file="pilot_roster.csv",
+        drone_file="drone_fleet.csv",
+        mission_file="missions.csv",
+        gsheets_creds="credentials.json",
+        sheet_mapping=sheet_mapping,
+    )
+
+
+@st.cache_resource
+def get_table_query():
+    return TableQuery(get_data_handler())
 
-data_handler = DataHandler(
-    pilot_file="pilot_roster.csv",
-    drone_file="drone_fleet.csv",
-    mission_file="missions.csv",
-    gsheets_creds="credentials.json",
-    sheet_mapping=sheet_mapping,
-)
+
+data_handler = get_data_handler()
+table_query = get_table_query()
+# The handler outlives sessions; re-pull Sheets in the background once the
+# last pull is older than the TTL, without blocking this rerun.
+data_handler.refresh_in_background(max_age=SHEETS_REFRESH_SECONDS)
 
 agent = DroneAgent(data_handler, api_key)
 conflict_detector = ConflictDetector(data_handler)
 
+
+def render_live_table(table, skill_label):
+    """Filter controls plus one server-side page of a live table."""
+    f1, f2, f3 = st.columns(3)
+    status = f1.selectbox(
+        "Status",
+        ["All"] + table_query.options(table, "status"),
+        key=f"{table}_status",
+    )
+    location = f2.selectbox(
+        "Location",
+        ["All"] + table_query.options(table, "location"),
+        key=f"{table}_location",
+    )
+    skill = f3.text_input(skill_label, key=f"{table}_skill")
+
+    f4, f5, f6 = st.columns(3)
+    date_range = f4.date_input(
+        TableQuery.DATE_COLUMNS[table].replace("_", " ").capitalize(),
+        value=(),
+        key=f"{table}_dates",
+    )
+    columns = data_handler.data.get(table, pd.DataFrame()).columns.tolist()
+    sort_by = f5.selectbox("Sort by", ["—"] + columns, key=f"{table}_sort")
+    descending = f6.toggle("Descending", key=f"{table}_desc")
+
+    date_from = date_range[0] if len(date_range) > 0 else None
+    date_to = date_range[1] if len(date_range) > 1 else None
+
+    filters = dict(
+        status=None if status == "All" else status,
+        location=None if location == "All" else location,
+        skill=skill or None,
+        date_from=date_from,
+        date_to=date_to,
+        sort_by=None if sort_by == "—" else sort_by,
+        ascending=not descending,
+    )
+
+    p1, p2 = st.columns(2)
+    page_size = p2.selectbox(
+        "Rows per page", [25, 50, 100, 250], index=1, key=f"{table}_size"
+    )
+    total = table_query.count(table, **filters)
+    pages = TableQuery.page_count(total, page_size)
+
+    # Back to page 1 when the filters or page size change; otherwise keep
+    # the page within range if the data shrank
+    page_key = f"{table}_page"
+    query_key = f"{table}_query"
+    query = (tuple(filters.values()), page_size)
+    if st.session_state.get(query_key) != query:
+        st.session_state[query_key] = query
+        st.session_state[page_key] = 1
+    elif st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+
+    page = p1.number_input(
+        f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=page_key
+    )
+    rows, total = table_query.page(table, page=page, page_size=page_size, **filters)
+
+    st.dataframe(rows, use_container_width=True, height=400, hide_index=True)
+    first = (page - 1) * page_size + 1 if total else 0
+    st.caption(f"Showing {first}–{min(page * page_size, total)} of {total}")
+
+
 # Layout: Split Screen
 col1, col2 = st.columns([1, 1], gap="large")
 
@@ -198,10 +284,10 @@ with col2:
     )
 
     with tab_pilots:
-        st.dataframe(data_handler.get_pilots(), use_container_width=True, height=400)
+        render_live_table("pilots", skill_label="Skill")
 
     with tab_drones:
-        st.dataframe(data_handler.get_drones(), use_container_width=True, height=400)
+        render_live_table("drones", skill_label="Capability")
 
     with tab_missions:
-        st.dataframe(data_handler.get_missions(), use_container_width=True, height=400)
+        render_live_table("missions", skill_label="Required skill")
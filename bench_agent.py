@@ -0,0 +1,183 @@
+"""Agent latency benchmark using recorded Gemini responses.
+
+Record once against the live API (needs GOOGLE_API_KEY), then replay
+offline as often as needed. Replay re-runs the recorded tool calls against
+a scratch copy of the local CSVs and reports per-query latency, tool calls,
+retries and prompt tokens sent across all of the query's model round trips
+(as recorded; "~" marks a chars/4 estimate). Queries with no recording, and
+recorded tool calls the current tools can't serve, are reported separately
+and kept out of the totals.
+
+Usage:
+    python bench_agent.py --record                  # writes agent_fixture.json
+    python bench_agent.py --latency 0.4 --error-rate 0.1 --seed 1
+    python bench_agent.py --queries my_queries.txt
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from dotenv import load_dotenv
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_QUERIES = [
+    "Which pilots are available in Bangalore?",
+    "Show me available thermal drones in Mumbai",
+    "Check for any active conflicts",
+    "Put drone D002 into maintenance",
+    "Ground all drones in Mumbai",
+    "I have an urgent reassignment request for PRJ002",
+]
+
+
+def load_queries(path):
+    if not path:
+        return DEFAULT_QUERIES
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def make_agent(workdir, genai_client, api_key):
+    # Keep replays offline: no public sheet pulls, no writes to real CSVs
+    for var in ("PILOT_SHEET_ID", "DRONE_SHEET_ID", "MISSIONS_SHEET_ID"):
+        os.environ[var] = ""
+
+    from src.data_handler import DataHandler
+    from src.agent import DroneAgent
+
+    files = {}
+    for name in ("pilot_roster.csv", "drone_fleet.csv", "missions.csv"):
+        files[name] = os.path.join(workdir, name)
+        shutil.copy(os.path.join(HERE, name), files[name])
+
+    dh = DataHandler(
+        pilot_file=files["pilot_roster.csv"],
+        drone_file=files["drone_fleet.csv"],
+        mission_file=files["missions.csv"],
+        warm_in_background=False,
+    )
+    return DroneAgent(dh, api_key, genai_client=genai_client)
+
+
+def record(args, queries):
+    from src.replay import GenAIRecorder
+
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        print("No API Key found")
+        return
+
+    recorder = GenAIRecorder(args.fixture)
+    with tempfile.TemporaryDirectory() as workdir:
+        agent = make_agent(workdir, recorder, api_key)
+        for query in queries:
+            agent.process_query(query)
+            status = "✅" if query in recorder.responses else "❌"
+            print(f"{status} {query}")
+    print(f"Saved {len(recorder.responses)} responses to {args.fixture}")
+
+
+def replay(args, queries):
+    from src.replay import GenAIReplayer
+
+    replayer = GenAIReplayer(
+        args.fixture,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    # Fixed starting key so key rotation is reproducible
+    random.seed(args.seed)
+    api_key = ",".join(f"replay-key-{i}" for i in range(args.keys))
+
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir:
+        agent = make_agent(workdir, replayer, api_key)
+        for query in queries:
+            replayer.reset_stats()
+            start = time.perf_counter()
+            agent.process_query(query)
+            elapsed = time.perf_counter() - start
+
+            s = replayer.stats
+            rows.append(
+                {
+                    "query": query,
+                    "latency": elapsed,
+                    "tool_calls": s["tool_calls"],
+                    "retries": max(0, s["sends"] - 1),
+                    "tokens": s["tokens_sent"],
+                    "estimated": s["tokens_estimated"],
+                    "missing": s["missing"] > 0,
+                    # Every send hit an injected 429 -> offline fallback
+                    "fallback": s["sends"] > 0 and s["sends"] == s["errors"],
+                    "mismatches": s["tool_mismatches"],
+                }
+            )
+
+    print(f"{'latency':>9}{'tools':>7}{'retries':>9}{'tokens':>9}  query")
+    for r in rows:
+        if r["missing"]:
+            print(f"{'-':>9}{'-':>7}{'-':>9}{'-':>9}  {r['query'][:50]} (no recording)")
+            continue
+        flag = " (fallback)" if r["fallback"] else ""
+        tokens = f"~{r['tokens']}" if r["estimated"] else str(r["tokens"])
+        print(
+            f"{r['latency']:>8.3f}s{r['tool_calls']:>7}{r['retries']:>9}"
+            f"{tokens:>9}  {r['query'][:50]}{flag}"
+        )
+        for mismatch in r["mismatches"]:
+            print(f"{'':>34}⚠️ tool mismatch: {mismatch}")
+
+    replayed = [r for r in rows if not r["missing"]]
+    if replayed:
+        latencies = [r["latency"] for r in replayed]
+        tokens = sum(r["tokens"] for r in replayed)
+        approx = "~" if any(r["estimated"] for r in replayed) else ""
+        print(
+            f"\n{len(replayed)} queries: median {statistics.median(latencies):.3f}s, "
+            f"max {max(latencies):.3f}s, "
+            f"{sum(r['tool_calls'] for r in replayed)} tool calls, "
+            f"{sum(r['retries'] for r in replayed)} retries, "
+            f"{approx}{tokens} tokens"
+        )
+
+    mismatches = sum(len(r["mismatches"]) for r in replayed)
+    if mismatches:
+        print(f"⚠️ {mismatches} recorded tool calls no longer match the tools.")
+    missing = len(rows) - len(replayed)
+    if missing:
+        print(
+            f"❌ {missing} queries have no recording in {args.fixture}; "
+            "run with --record to capture them."
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixture", default=os.path.join(HERE, "agent_fixture.json"))
+    parser.add_argument("--queries", help="File with one query per line")
+    parser.add_argument("--record", action="store_true", help="Call the live API")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--keys", type=int, default=2, help="Fake keys to rotate")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    load_dotenv()
+    queries = load_queries(args.queries)
+    if args.record:
+        record(args, queries)
+    else:
+        replay(args, queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Startup benchmark: time-to-first-render with and without credentials.
+
+Each run happens in a fresh interpreter so import costs are measured cold.
+"First render" covers everything app.py does before the first table can be
+drawn: importing the modules, building the DataHandler and DroneAgent, and
+reading the three tables. "Warm" is when the Sheets connector / public sheet
+pulls have finished in the background.
+
+Usage:
+    python bench_startup.py                     # uses ./credentials.json if present
+    python bench_startup.py --creds path/to/key.json --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def child(creds, blocking):
+    start = time.perf_counter()
+
+    from src.data_handler import DataHandler
+    from src.agent import DroneAgent
+
+    imported = time.perf_counter()
+
+    dh = DataHandler(
+        pilot_file="pilot_roster.csv",
+        drone_file="drone_fleet.csv",
+        mission_file="missions.csv",
+        gsheets_creds=creds,
+        warm_in_background=not blocking,
+    )
+    DroneAgent(dh, os.getenv("GOOGLE_API_KEY"))
+    for df in (dh.get_pilots(), dh.get_drones(), dh.get_missions()):
+        df.to_json()
+
+    rendered = time.perf_counter()
+    dh.wait_for_connectors()
+    warm = time.perf_counter()
+
+    print(
+        json.dumps(
+            {
+                "import": imported - start,
+                "first_render": rendered - start,
+                "warm": warm - start,
+            }
+        )
+    )
+
+
+def run_scenario(creds, blocking, runs):
+    cmd = [sys.executable, __file__, "--child", "--creds", creds or ""]
+    if blocking:
+        cmd.append("--blocking")
+
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(cmd, cwd=HERE, capture_output=True, text=True, check=True)
+        # Last line is our JSON; anything before it is DataHandler logging
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    return {k: statistics.median(s[k] for s in samples) for k in samples[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--creds", default="credentials.json")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--blocking", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.creds or None, args.blocking)
+        return
+
+    scenarios = [("no credentials", None)]
+    if os.path.exists(args.creds):
+        scenarios.append(("credentials", args.creds))
+    else:
+        print(f"⚠️ {args.creds} not found, skipping credentials scenario.")
+
+    print(f"{'scenario':<18}{'mode':<12}{'import':>10}{'render':>10}{'warm':>10}")
+    for name, creds in scenarios:
+        for blocking in (False, True):
+            t = run_scenario(creds, blocking, args.runs)
+            mode = "blocking" if blocking else "background"
+            print(
+                f"{name:<18}{mode:<12}"
+                f"{t['import']:>9.3f}s{t['first_render']:>9.3f}s{t['warm']:>9.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,23 @@
-import google.generativeai as genai
+import pandas as pd
 from src.logic import RosterManager, FleetManager, ConflictDetector
 from src.system_prompts import MANUAL_CONTEXT
+from src.utils import normalize_string
 import time
 import random
 
 
+def _genai():
+    """Imports google.generativeai on first use (it is slow to import)."""
+    import google.generativeai as genai
+
+    return genai
+
+
 class DroneAgent:
-    def __init__(self, data_handler, api_key=None):
+    def __init__(self, data_handler, api_key=None, genai_client=None):
         self.dh = data_handler
+        # Stand-in for the google.generativeai module (e.g. record/replay)
+        self.genai_client = genai_client
         self.roster_mgr = RosterManager(data_handler)
         self.fleet_mgr = FleetManager(data_handler)
         self.conflict_det = ConflictDetector(data_handler)
@@ -29,6 +39,7 @@ class DroneAgent:
             return False
 
         current_key = self.api_keys[self.current_key_index]
+        genai = self.genai_client or _genai()
         genai.configure(api_key=current_key)
         return True
 
@@ -62,37 +73,75 @@ class DroneAgent:
 
         def update_pilot_status(pilot_id: str, status: str):
             """Updates a pilot's status (Available, On Leave, Assigned) and syncs."""
-            df = self.dh.get_pilots()
-            if pilot_id not in df["pilot_id"].values:
-                return f"Error: Pilot {pilot_id} not found."
-
-            # Update local
-            df.loc[df["pilot_id"] == pilot_id, "status"] = status
-            self.dh.update_pilots(df)
-
-            # Try sync
-            sync_res = self.dh.sync_to_sheets()
+            change = {"table": "pilots", "id": pilot_id, "values": {"status": status}}
+            try:
+                sync_res = self.dh.apply_changes([change])
+            except ValueError as e:
+                return f"Error: {e}"
             return f"Updated {pilot_id} to {status}. Sync Result: {sync_res}"
 
         def update_drone_status(drone_id: str, status: str):
             """Updates a drone's status (Available, Maintenance, Deployed) and syncs."""
-            df = self.dh.get_drones()
-            if drone_id not in df["drone_id"].values:
-                return f"Error: Drone {drone_id} not found."
-
-            # Update local
-            df.loc[df["drone_id"] == drone_id, "status"] = status
-            self.dh.update_drones(df)
-
-            # Try sync
-            sync_res = self.dh.sync_to_sheets()
+            change = {"table": "drones", "id": drone_id, "values": {"status": status}}
+            try:
+                sync_res = self.dh.apply_changes([change])
+            except ValueError as e:
+                return f"Error: {e}"
             return f"Updated {drone_id} to {status}. Sync Result: {sync_res}"
 
+        def bulk_update_status(
+            table: str,
+            status: str,
+            ids: list[str] = None,
+            location: str = None,
+            current_status: str = None,
+        ):
+            """Sets the same status on many pilots or drones in one call.
+            table is "pilots" or "drones". Select rows either by ids (pilot_id/drone_id
+            values) or by filters: location and/or current_status (e.g. ground all
+            drones in Mumbai with table="drones", location="Mumbai", status="Maintenance").
+            All updates succeed or none do, then data is saved and synced once."""
+            if table not in ("pilots", "drones"):
+                return f"Error: Unknown table {table}. Use pilots or drones."
+            if not (ids or location or current_status):
+                return "Error: Give ids, location or current_status to select rows."
+
+            if not ids:
+                # Select on the full table here; the listing tools are capped
+                df = self.dh.data.get(table, pd.DataFrame())
+                if location:
+                    df = df[
+                        df["location"].apply(normalize_string)
+                        == normalize_string(location)
+                    ]
+                if current_status:
+                    df = df[
+                        df["status"].apply(normalize_string)
+                        == normalize_string(current_status)
+                    ]
+                ids = df[self.dh.PRIMARY_KEYS[table]].tolist()
+                if not ids:
+                    return f"No {table} matched those filters. No changes were made."
+
+            changes = [
+                {"table": table, "id": row_id, "values": {"status": status}}
+                for row_id in ids
+            ]
+            try:
+                sync_res = self.dh.apply_changes(changes)
+            except ValueError as e:
+                return f"Error: {e} No changes were made."
+            return (
+                f"Updated {len(ids)} {table} ({', '.join(map(str, ids))}) to {status}. "
+                f"Sync Result: {sync_res}"
+            )
+
         tools = [
             check_availability,
             check_drone_inventory,
             update_pilot_status,
             update_drone_status,
+            bulk_update_status,
         ]
 
         # Retry logic with Key Rotation
@@ -107,6 +156,7 @@ class DroneAgent:
                 if not self._configure_genai():
                     return self.mock_response(query)
 
+                genai = self.genai_client or _genai()
                 model = genai.GenerativeModel(model_name=self.model_name, tools=tools)
 
                 chat = model.start_chat(enable_automatic_function_calling=True)
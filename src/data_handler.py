@@ -1,7 +1,11 @@
 import pandas as pd
 import os
+import threading
+import time
 from typing import Optional, Dict, Any, List
 from src.sheets_sync import GoogleSheetsConnector
+from src.scenario import Scenario, evaluate_scenarios
+from src.utils import canonical_value, fingerprint_rows
 
 try:
     from dotenv import load_dotenv
@@ -12,6 +16,13 @@ except:
 
 
 class DataHandler:
+    # Primary key column for each table
+    PRIMARY_KEYS = {
+        "pilots": "pilot_id",
+        "drones": "drone_id",
+        "missions": "project_id",
+    }
+
     def __init__(
         self,
         pilot_file: str,
@@ -19,6 +30,7 @@ class DataHandler:
         mission_file: str,
         gsheets_creds: Optional[str] = None,
         sheet_mapping: Optional[Dict[str, str]] = None,
+        warm_in_background: bool = True,
     ):
         self.files = {
             "pilots": pilot_file,
@@ -26,9 +38,16 @@ class DataHandler:
             "missions": mission_file,
         }
         self.data = {}
+        # Bumped on every change to a table; lets views memoize per version
+        self.versions = {key: 0 for key in self.files}
+        self._lock = threading.RLock()
         self.gsheets_creds = gsheets_creds
         self.connector = None
         self.sheet_mapping = sheet_mapping or {}
+        self._sheet_revisions = {}
+        # Monotonic time of the last pull from Sheets; see refresh_in_background
+        self._last_pull = time.monotonic()
+        self._refreshing = False
 
         # Check for Sheet IDs in env
         self.sheet_ids = {
@@ -37,19 +56,37 @@ class DataHandler:
             "missions": os.getenv("MISSIONS_SHEET_ID"),
         }
 
-        # Load initial data
+        # Load initial data (local CSVs only, so the UI can render right away)
         self.load_data()
 
-        # Initialize Sheets Connector if creds exist
-        if self.gsheets_creds and os.path.exists(self.gsheets_creds):
-            try:
-                self.connector = GoogleSheetsConnector(self.gsheets_creds)
-                print("✅ Google Sheets Connector Initialized")
-            except Exception as e:
-                print(f"⚠️ Failed to initialize Google Sheets: {e}")
+        # Connector setup and public sheet pulls hit the network; run them
+        # off the main thread unless the caller wants to block on them.
+        self._warm_done = threading.Event()
+        if warm_in_background:
+            threading.Thread(target=self._warm_connectors, daemon=True).start()
         else:
-            print("⚠️ No credentials found. Attempting to fetch public sheets...")
-            self.sync_from_public_sheets()
+            self._warm_connectors()
+
+    def _warm_connectors(self):
+        """Initializes the Sheets connector or pulls public sheets."""
+        try:
+            # Initialize Sheets Connector if creds exist
+            if self.gsheets_creds and os.path.exists(self.gsheets_creds):
+                try:
+                    self.connector = GoogleSheetsConnector(self.gsheets_creds)
+                    print("✅ Google Sheets Connector Initialized")
+                except Exception as e:
+                    print(f"⚠️ Failed to initialize Google Sheets: {e}")
+            else:
+                print("⚠️ No credentials found. Attempting to fetch public sheets...")
+                self.sync_from_public_sheets()
+        finally:
+            self._last_pull = time.monotonic()
+            self._warm_done.set()
+
+    def wait_for_connectors(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until background connector setup has finished."""
+        return self._warm_done.wait(timeout)
 
     def sync_from_public_sheets(self):
         """Attempts to load data from public Google Sheet URLs."""
@@ -58,15 +95,50 @@ class DataHandler:
                 continue
 
             try:
+                # The fetch runs outside the lock; edits saved meanwhile win
+                version = self.versions.get(key, 0)
                 url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
                 df = pd.read_csv(url)
                 if not df.empty:
-                    self.data[key] = df
-                    self.save_data(key)  # Update local CSV
+                    with self._lock:
+                        if self.versions.get(key, 0) != version:
+                            print(f"⚠️ Skipped {key} public sheet: edited during pull")
+                            continue
+                        self.data[key] = df
+                        self.save_data(key)  # Update local CSV
                     print(f"✅ Pulled {key} from public sheet")
             except Exception as e:
                 print(f"⚠️ Could not pull {key} from public sheet: {e}")
 
+    def refresh_in_background(self, max_age: float = 300.0) -> bool:
+        """Re-pulls Sheets on a background thread if the data is stale.
+
+        Does nothing if the last pull finished less than max_age seconds ago
+        or a refresh is already running. Uses the incremental pull when the
+        connector is set up, otherwise the public sheets. Returns True if a
+        refresh was started.
+        """
+        with self._lock:
+            if self._refreshing or time.monotonic() - self._last_pull < max_age:
+                return False
+            self._refreshing = True
+        threading.Thread(target=self._refresh, daemon=True).start()
+        return True
+
+    def _refresh(self):
+        try:
+            self.wait_for_connectors()
+            if self.connector:
+                self.sync_from_sheets_incremental()
+            else:
+                self.sync_from_public_sheets()
+        except Exception as e:
+            print(f"⚠️ Background refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._last_pull = time.monotonic()
+                self._refreshing = False
+
     def load_data(self):
         """Loads data from CSV files."""
         for key, filepath in self.files.items():
@@ -80,10 +152,13 @@ class DataHandler:
     def save_data(self, key: str):
         """Saves current dataframe to CSV."""
         if key in self.files and key in self.data:
+            # Every mutation ends in a save, so this is where the version moves
+            self.versions[key] = self.versions.get(key, 0) + 1
             self.data[key].to_csv(self.files[key], index=False)
 
     def sync_to_sheets(self):
         """Syncs local data to Google Sheets."""
+        self.wait_for_connectors()
         if not self.connector:
             return "Google Sheets not configured."
 
@@ -105,6 +180,7 @@ class DataHandler:
 
     def sync_from_sheets(self):
         """Pull data from Google Sheets."""
+        self.wait_for_connectors()
         if not self.connector:
             return "Google Sheets not configured."
 
@@ -118,13 +194,143 @@ class DataHandler:
                 try:
                     new_df = self.connector.read_sheet(target)
                     if not new_df.empty:
-                        self.data[key] = new_df
-                        self.save_data(key)  # Update local CSV
+                        with self._lock:
+                            self.data[key] = new_df
+                            self.save_data(key)  # Update local CSV
                         results.append(f"✅ Pulled {key}")
                 except Exception as e:
                     results.append(f"❌ Failed {key}: {e}")
         return "\n".join(results)
 
+    def sync_from_sheets_incremental(self) -> Dict[str, Dict[str, Any]]:
+        """Pulls only rows that changed in Google Sheets.
+
+        Sheets whose revision is unchanged since the last pull are skipped.
+        Otherwise rows are fingerprinted by primary key and only inserted,
+        updated or deleted rows are applied to the local table, which is
+        saved once if anything changed. Returns a change set per table:
+        {"inserted": [...], "updated": [...], "deleted": [...],
+         "duplicates": [...], "replaced": bool, "skipped": bool,
+         "error": str or None}.
+        Duplicate primary keys on either side keep their last row and are
+        listed under "duplicates". If the columns differ, the local table is
+        replaced by the sheet: "replaced" is set and "inserted"/"deleted"
+        list the ids that are new or gone.
+        """
+        self.wait_for_connectors()
+        if not self.connector:
+            return {}
+
+        changes = {}
+        for key in list(self.data.keys()):
+            sheet_name = self.sheet_mapping.get(key)
+            sheet_id = self.sheet_ids.get(key)
+            target = sheet_id if sheet_id else sheet_name
+            if not target:
+                continue
+
+            change = {
+                "inserted": [],
+                "updated": [],
+                "deleted": [],
+                "duplicates": [],
+                "replaced": False,
+                "skipped": False,
+                "error": None,
+            }
+            changes[key] = change
+
+            try:
+                revision = self.connector.get_revision(target)
+                if revision and revision == self._sheet_revisions.get(key):
+                    change["skipped"] = True
+                    continue
+
+                remote = self.connector.read_sheet(target)
+                if remote.empty:
+                    continue
+
+                with self._lock:
+                    merged = self._merge_rows(key, remote, change)
+                    if merged is not None:
+                        self.data[key] = merged
+                        self.save_data(key)  # Update local CSV
+
+                if revision:
+                    self._sheet_revisions[key] = revision
+            except Exception as e:
+                change["error"] = str(e)
+
+        return changes
+
+    def _merge_rows(self, key: str, remote: pd.DataFrame, change: Dict[str, Any]):
+        """Fills `change` and returns the merged table, or None if unchanged."""
+        local = self.data.get(key, pd.DataFrame())
+        pk = self.PRIMARY_KEYS[key]
+
+        # Without a usable key or with a new schema, fall back to replacing
+        if (
+            pk not in local.columns
+            or pk not in remote.columns
+            or set(local.columns) != set(remote.columns)
+        ):
+            # Every row is rewritten; ids are still diffed so callers can
+            # tell new and removed rows apart from the rewrite
+            local_ids = list(local[pk].map(canonical_value)) if pk in local else []
+            remote_ids = list(remote[pk].map(canonical_value)) if pk in remote else []
+            local_set, remote_set = set(local_ids), set(remote_ids)
+            change.update(
+                inserted=[i for i in dict.fromkeys(remote_ids) if i not in local_set],
+                deleted=[i for i in dict.fromkeys(local_ids) if i not in remote_set],
+                replaced=True,
+            )
+            return remote
+
+        # Ids are compared in canonical text form on both sides
+        local_keys = local[pk].map(canonical_value)
+        remote_keys = remote[pk].map(canonical_value)
+        change["duplicates"] = sorted(
+            set(local_keys[local_keys.duplicated()])
+            | set(remote_keys[remote_keys.duplicated()])
+        )
+        local_dups = bool(local_keys.duplicated().any())
+        local = local[~local_keys.duplicated(keep="last")]
+        remote = remote[~remote_keys.duplicated(keep="last")]
+
+        local_fp = fingerprint_rows(local, pk)
+        remote_fp = fingerprint_rows(remote, pk)
+
+        local_ids = set(local_fp.index)
+        remote_ids = set(remote_fp.index)
+        inserted = [i for i in remote_fp.index if i not in local_ids]
+        deleted = [i for i in local_fp.index if i not in remote_ids]
+        updated = [
+            i for i in local_fp.index if i in remote_ids and local_fp[i] != remote_fp[i]
+        ]
+
+        change.update(inserted=inserted, updated=updated, deleted=deleted)
+        # Collapsing local duplicates is itself a change worth saving
+        if not (inserted or updated or deleted or local_dups):
+            return None
+
+        local_idx = local.set_index(local[pk].map(canonical_value))
+        remote_idx = remote.set_index(remote[pk].map(canonical_value))[local.columns]
+
+        # Keep local row order, with new rows appended at the end
+        kept = local_idx.drop(index=deleted + updated)
+        merged = pd.concat([kept, remote_idx.loc[updated + inserted]])
+        order = [i for i in local_idx.index if i not in set(deleted)] + inserted
+        return merged.loc[order].reset_index(drop=True)
+
+    # What-if scenarios
+    def fork_scenario(self, name: Optional[str] = None):
+        """Creates a copy-on-write what-if fork of the current tables."""
+        return Scenario(self, name)
+
+    def evaluate_scenarios(self, scenarios, workers: Optional[int] = None):
+        """Evaluates many forks in parallel; results keep the input order."""
+        return evaluate_scenarios(scenarios, workers=workers)
+
     # Getters
     def get_pilots(self):
         return self.data.get("pilots", pd.DataFrame())
@@ -137,9 +343,92 @@ class DataHandler:
 
     # Setters
     def update_pilots(self, df):
-        self.data["pilots"] = df
-        self.save_data("pilots")
+        with self._lock:
+            self.data["pilots"] = df
+            self.save_data("pilots")
 
     def update_drones(self, df):
-        self.data["drones"] = df
-        self.save_data("drones")
+        with self._lock:
+            self.data["drones"] = df
+            self.save_data("drones")
+
+    # Batch mutations
+    def apply_changes(
+        self,
+        changes: List[Dict[str, Any]],
+        sync: bool = True,
+        base_versions: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Applies a batch of row-level changes atomically.
+
+        Each change is a dict like
+        {"table": "drones", "id": "D001", "values": {"status": "Maintenance"}}.
+        Every change is validated before anything is touched; if validation or
+        saving fails, all tables are rolled back and ValueError is raised.
+        Each touched table is written once and Sheets is synced once.
+
+        If base_versions is given, every touched table must still be at that
+        version, so changes computed from an older read can't overwrite newer
+        data.
+        """
+        with self._lock:
+            # 1. Validate everything up front
+            for change in changes:
+                self._validate_change(change)
+            if base_versions is not None:
+                for key in sorted({change["table"] for change in changes}):
+                    if self.versions.get(key) != base_versions.get(key):
+                        raise ValueError(
+                            f"{key} changed since these changes were prepared."
+                        )
+
+            # 2. Apply to working copies, then persist once per touched table
+            originals = {}
+            saved = []
+            try:
+                for change in changes:
+                    key = change["table"]
+                    if key not in originals:
+                        originals[key] = self.data[key]
+                        self.data[key] = self.data[key].copy()
+
+                    df = self.data[key]
+                    mask = df[self.PRIMARY_KEYS[key]] == change["id"]
+                    for column, value in change["values"].items():
+                        df.loc[mask, column] = value
+
+                for key in originals:
+                    saved.append(key)
+                    self.save_data(key)
+            except Exception as e:
+                # 3. Roll back memory and any CSVs already rewritten
+                self.data.update(originals)
+                for key in saved:
+                    try:
+                        self.save_data(key)
+                    except Exception:
+                        pass
+                raise ValueError(f"Failed to apply changes, rolled back: {e}")
+
+        # 4. Sync once, outside the lock
+        if sync and originals:
+            return self.sync_to_sheets()
+        return ""
+
+    def _validate_change(self, change: Dict[str, Any]):
+        """Raises ValueError if a change cannot be applied."""
+        key = change.get("table")
+        if key not in self.PRIMARY_KEYS:
+            raise ValueError(f"Unknown table: {key}")
+
+        df = self.data.get(key, pd.DataFrame())
+        pk = self.PRIMARY_KEYS[key]
+        if pk not in df.columns or change.get("id") not in df[pk].values:
+            raise ValueError(f"{key}: {change.get('id')} not found.")
+
+        values = change.get("values") or {}
+        if not values:
+            raise ValueError(f"{key}: no values given for {change.get('id')}.")
+        unknown = [c for c in values if c not in df.columns]
+        if unknown:
+            raise ValueError(f"{key}: unknown columns {', '.join(unknown)}.")
@@ -1,7 +1,16 @@
 import pandas as pd
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from src.utils import calculate_duration, normalize_string
 
+# Payload of the current pool, set in each worker process by its initializer.
+# Never assigned in the parent, so concurrent callers can't see each other's.
+_WORKER_PAYLOAD = None
+
 
 class RosterManager:
     def __init__(self, data_handler):
@@ -83,13 +92,196 @@ class FleetManager:
         return True
 
 
+class TableQuery:
+    """Filtered, sorted and paginated views over the live tables.
+
+    Filtering and sorting happen here rather than in the browser; only the
+    requested page is returned. Results are memoized per table version, so
+    reruns with the same filters are free until the data changes.
+    """
+
+    # Column used for the skill and date-range filters on each table
+    SKILL_COLUMNS = {
+        "pilots": "skills",
+        "drones": "capabilities",
+        "missions": "required_skills",
+    }
+    DATE_COLUMNS = {
+        "pilots": "available_from",
+        "drones": "maintenance_due",
+        "missions": "start_date",
+    }
+
+    def __init__(self, data_handler, cache_size=64):
+        self.dh = data_handler
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def page(
+        self,
+        table,
+        status=None,
+        location=None,
+        skill=None,
+        date_from=None,
+        date_to=None,
+        sort_by=None,
+        ascending=True,
+        page=1,
+        page_size=50,
+    ):
+        """Returns (rows for the page, total matching rows).
+
+        `page` is clamped to the available pages, so a stale page number
+        shows the last page rather than nothing.
+        """
+        filters = (status, location, skill, date_from, date_to, sort_by, ascending)
+        df = self._rows(table, filters)
+
+        page = min(max(1, int(page)), self.page_count(len(df), page_size))
+        start = (page - 1) * page_size
+        rows = self._memo(
+            ("page", table) + filters + (page, page_size),
+            lambda: df.iloc[start : start + page_size],
+        )
+        return rows, len(df)
+
+    def count(
+        self,
+        table,
+        status=None,
+        location=None,
+        skill=None,
+        date_from=None,
+        date_to=None,
+        sort_by=None,
+        ascending=True,
+    ):
+        """Number of rows matching the filters."""
+        filters = (status, location, skill, date_from, date_to, sort_by, ascending)
+        return len(self._rows(table, filters))
+
+    @staticmethod
+    def page_count(total, page_size):
+        """Pages needed for `total` rows; at least one, even when empty."""
+        return max(1, -(-total // page_size))
+
+    def _rows(self, table, filters):
+        return self._memo(
+            ("rows", table) + filters, lambda: self._filter(table, *filters)
+        )
+
+    def options(self, table, column):
+        """Distinct sorted values of a column, for filter dropdowns."""
+        df = self.dh.data.get(table, pd.DataFrame())
+        if column not in df.columns:
+            return []
+        return self._memo(
+            ("options", table, column),
+            lambda: sorted(df[column].dropna().astype(str).unique().tolist()),
+        )
+
+    def _filter(
+        self, table, status, location, skill, date_from, date_to, sort_by, ascending
+    ):
+        df = self.dh.data.get(table, pd.DataFrame())
+        if df.empty:
+            return df
+
+        mask = pd.Series(True, index=df.index)
+
+        if status and "status" in df.columns:
+            mask &= df["status"] == status
+
+        if location and "location" in df.columns:
+            mask &= _normalized(df["location"]) == normalize_string(location)
+
+        skill_col = self.SKILL_COLUMNS.get(table)
+        if skill and skill_col in df.columns:
+            mask &= _normalized(df[skill_col]).str.contains(
+                normalize_string(skill), regex=False
+            )
+
+        date_col = self.DATE_COLUMNS.get(table)
+        if (date_from or date_to) and date_col in df.columns:
+            dates = pd.to_datetime(df[date_col], errors="coerce")
+            if date_from:
+                mask &= dates >= pd.to_datetime(date_from)
+            if date_to:
+                mask &= dates <= pd.to_datetime(date_to)
+
+        df = df[mask]
+        if sort_by and sort_by in df.columns:
+            df = df.sort_values(
+                sort_by, ascending=ascending, kind="stable", key=_sort_key
+            )
+        return df
+
+    def _memo(self, key, compute):
+        """LRU cache keyed by the table's current data version."""
+        key = key + (self.dh.versions.get(key[1], 0),)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        value = compute()
+        with self._lock:
+            self._cache[key] = value
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return value
+
+
+def _normalized(series):
+    """Vectorized normalize_string for a column."""
+    return series.fillna("").astype(str).str.lower().str.strip()
+
+
+def _sort_key(series):
+    """Sort key for object columns mixing types (e.g. numbers and text).
+
+    All-numeric values sort as numbers, anything else as text; missing
+    values stay missing so they still sort last.
+    """
+    if not pd.api.types.is_object_dtype(series):
+        return series
+    numbers = pd.to_numeric(series, errors="coerce")
+    if numbers.notna().sum() == series.notna().sum():
+        return numbers
+    return series.astype(str).where(series.notna())
+
+
+def run_in_pool(func, payload, tasks, workers):
+    """Maps func(payload, task) over tasks in a process pool.
+
+    The payload is pickled once per worker through the pool initializer
+    rather than once per task. Results come back in task order.
+    """
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(tasks)),
+        initializer=_set_worker_payload,
+        initargs=(payload,),
+    ) as pool:
+        return list(pool.map(partial(_call_with_payload, func), tasks))
+
+
+def _set_worker_payload(payload):
+    global _WORKER_PAYLOAD
+    _WORKER_PAYLOAD = payload
+
+
+def _call_with_payload(func, task):
+    return func(_WORKER_PAYLOAD, task)
+
+
 class ConflictDetector:
     def __init__(self, data_handler):
         self.dh = data_handler
         self.roster_mgr = RosterManager(data_handler)
 
     def check_assignment(self, pilot_id, drone_id, mission_id):
-        issues = []
         mission = self.dh.get_missions()[
             self.dh.get_missions()["project_id"] == mission_id
         ].iloc[0]
@@ -99,10 +291,16 @@ class ConflictDetector:
         drone = self.dh.get_drones()[self.dh.get_drones()["drone_id"] == drone_id].iloc[
             0
         ]
+        return self._assignment_issues(pilot, mission)
+
+    def _assignment_issues(self, pilot, mission, duration=None):
+        """Rule checks for one pilot/mission pair (rows as Series or dicts)."""
+        issues = []
 
         # 1. Budget Check
-        duration = calculate_duration(mission["start_date"], mission["end_date"])
-        cost = self.roster_mgr.calculate_cost(pilot_id, duration)
+        if duration is None:
+            duration = calculate_duration(mission["start_date"], mission["end_date"])
+        cost = pilot["daily_rate_inr"] * duration
         if cost > mission["mission_budget_inr"]:
             issues.append(
                 f"Budget Overrun: Pilot cost {cost} > Budget {mission['mission_budget_inr']}"
@@ -122,31 +320,111 @@ class ConflictDetector:
 
     def check_all_active_conflicts(self):
         """Checks conflicts for all active assignments."""
-        issues = []
         pilots = self.dh.get_pilots()
-        drones = self.dh.get_drones()
+        positions = self._assigned_positions(pilots)
+        rows = pilots.iloc[positions].to_dict("records")
+        results = self._check_rows(positions, rows, self._lookups())
+        return [issue for _, row_issues in results for issue in row_issues]
+
+    def check_all_active_conflicts_parallel(self, shard_by="location", workers=None):
+        """Checks all active assignments across a process pool.
+
+        Assigned pilots are grouped by their `location` (or by mission id
+        when shard_by="mission") and the groups are packed into one shard
+        per worker. Each worker receives only its shard's pilots and the
+        drones and missions they reference. Issues are merged back in
+        roster order, so the result is identical to
+        check_all_active_conflicts().
+        """
+        pilots = self.dh.get_pilots()
+        workers = workers or os.cpu_count() or 1
+        shards = shard_assignments(pilots, shard_by=shard_by, num_shards=workers)
 
-        # Filter accepted assignments
-        assigned_pilots = pilots[pilots["current_assignment"] != "-"]
+        # Not worth paying for process startup
+        if workers <= 1 or len(shards) <= 1:
+            return self.check_all_active_conflicts()
 
-        for _, pilot in assigned_pilots.iterrows():
+        drones = self.dh.get_drones()
+        missions = self.dh.get_missions()
+        # First row per pilot id, as in the serial lookups
+        first_pilots = pilots.drop_duplicates(subset="pilot_id")
+
+        tasks = []
+        for shard in shards:
+            rows = pilots.iloc[shard]
+            mission_ids = rows["current_assignment"].unique()
+            snapshot = _TableSnapshot(
+                _rows_in(first_pilots, "pilot_id", rows["pilot_id"].unique()),
+                _rows_in(drones, "current_assignment", mission_ids),
+                _rows_in(missions, "project_id", mission_ids),
+            )
+            tasks.append((shard, rows.to_dict("records"), snapshot))
+
+        shard_results = run_in_pool(_check_shard, None, tasks, workers)
+
+        # Deterministic merge: restore original roster order
+        results = sorted(r for shard in shard_results for r in shard)
+        return [issue for _, row_issues in results for issue in row_issues]
+
+    @staticmethod
+    def _assigned_positions(pilots):
+        """Row positions of pilots with an active assignment."""
+        if pilots.empty:
+            return []
+        mask = (pilots["current_assignment"] != "-").tolist()
+        return [i for i, assigned in enumerate(mask) if assigned]
+
+    def _lookups(self):
+        """Id-keyed rows built once per sweep, so each check is O(1).
+
+        Like the .iloc[0] lookups in check_assignment, the first row wins
+        when an id is duplicated. The last item is a per-mission duration
+        cache, filled on first use.
+        """
+
+        def first_rows(df, column):
+            if column not in df.columns:
+                return {}
+            df = df.drop_duplicates(subset=column)
+            return dict(zip(df[column], df.to_dict("records")))
+
+        return (
+            first_rows(self.dh.get_pilots(), "pilot_id"),
+            first_rows(self.dh.get_drones(), "current_assignment"),
+            first_rows(self.dh.get_missions(), "project_id"),
+            {},
+        )
+
+    def _check_rows(self, positions, rows, lookups):
+        """Checks assigned pilot rows, returning (position, issues) pairs."""
+        results = []
+        pilots_by_id, drones_by_mission, missions_by_id, durations = lookups
+
+        for pos, pilot in zip(positions, rows):
+            issues = []
             mission_id = pilot["current_assignment"]
-            pilot_id = pilot["pilot_id"]
 
             # Find drone assigned to same mission
-            assigned_drone = drones[drones["current_assignment"] == mission_id]
-
-            if assigned_drone.empty:
+            if mission_id not in drones_by_mission:
                 issues.append(
                     f"⚠️ Mission {mission_id}: Pilot {pilot['name']} assigned but no Drone assigned."
                 )
+                results.append((pos, issues))
                 continue
 
-            drone_id = assigned_drone.iloc[0]["drone_id"]
-
             try:
                 # Check for conflicts
-                conflict_list = self.check_assignment(pilot_id, drone_id, mission_id)
+                mission = missions_by_id.get(mission_id)
+                if mission is None:
+                    raise ValueError(f"Mission {mission_id} not found")
+                # Date parsing dominates the sweep; do it once per mission
+                if mission_id not in durations:
+                    durations[mission_id] = calculate_duration(
+                        mission["start_date"], mission["end_date"]
+                    )
+                conflict_list = self._assignment_issues(
+                    pilots_by_id[pilot["pilot_id"]], mission, durations[mission_id]
+                )
                 if conflict_list:
                     for c in conflict_list:
                         issues.append(f"🚨 Mission {mission_id} Conflict: {c}")
@@ -154,4 +432,76 @@ class ConflictDetector:
                 # Fallback if mission ID doesn't match or other data issue
                 issues.append(f"⚠️ Error checking Mission {mission_id}: {e}")
 
-        return issues
+            results.append((pos, issues))
+
+        return results
+
+
+def shard_assignments(pilots, shard_by="location", num_shards=1):
+    """Packs assigned pilot row positions into at most num_shards shards.
+
+    Rows are grouped by pilot location (or mission id for
+    shard_by="mission"). Groups are placed largest-first and each shard is
+    filled to an even share before moving on, splitting a group only where
+    it crosses a shard boundary, so shard sizes differ by at most one row.
+    Returns non-empty, sorted position lists in a deterministic order.
+    """
+    if shard_by not in ("location", "mission"):
+        raise ValueError(f"Unknown shard key: {shard_by}")
+
+    positions = ConflictDetector._assigned_positions(pilots)
+    if not positions:
+        return []
+
+    num_shards = max(1, min(num_shards, len(positions)))
+    column = "location" if shard_by == "location" else "current_assignment"
+    keys = pilots[column].iloc[positions].astype(str).map(normalize_string).tolist()
+
+    groups = {}
+    for pos, key in zip(positions, keys):
+        groups.setdefault(key, []).append(pos)
+
+    # Shard i holds `base` rows, plus one for the first `extra` shards
+    base, extra = divmod(len(positions), num_shards)
+    capacities = [base + (1 if i < extra else 0) for i in range(num_shards)]
+
+    shards = [[]]
+    for _, group in sorted(groups.items(), key=lambda g: (-len(g[1]), g[0])):
+        while group:
+            space = capacities[len(shards) - 1] - len(shards[-1])
+            if space == 0:
+                shards.append([])
+                continue
+            shards[-1].extend(group[:space])
+            group = group[space:]
+
+    return [sorted(shard) for shard in shards if shard]
+
+
+class _TableSnapshot:
+    """Read-only stand-in for DataHandler holding just the tables."""
+
+    def __init__(self, pilots, drones, missions):
+        self.data = {"pilots": pilots, "drones": drones, "missions": missions}
+
+    def get_pilots(self):
+        return self.data["pilots"]
+
+    def get_drones(self):
+        return self.data["drones"]
+
+    def get_missions(self):
+        return self.data["missions"]
+
+
+def _rows_in(df, column, values):
+    """Rows of df whose column is in values (all rows if the column is absent)."""
+    if column not in df.columns:
+        return df
+    return df[df[column].isin(values)]
+
+
+def _check_shard(_, task):
+    positions, rows, snapshot = task
+    detector = ConflictDetector(snapshot)
+    return detector._check_rows(positions, rows, detector._lookups())
@@ -0,0 +1,244 @@
+import json
+import os
+import random
+import time
+from typing import Optional
+
+# Record/replay stand-ins for the google.generativeai module, passed to
+# DroneAgent(genai_client=...). The recorder wraps the real SDK and saves
+# each response plus the automatic function calls it made; the replayer
+# serves those back offline, re-running the same tool calls locally.
+
+
+def _user_query(message: str) -> str:
+    """Fixture key: the operator's query, without the system prompt."""
+    marker = "\nUser: "
+    return message.rsplit(marker, 1)[-1] if marker in message else message
+
+
+def _to_plain(value):
+    """Converts protobuf maps/lists from function call args to JSON types."""
+    if hasattr(value, "items"):
+        return {k: _to_plain(v) for k, v in value.items()}
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return [_to_plain(v) for v in value]
+
+
+def _recorded_tokens(value) -> Optional[int]:
+    """Prompt tokens sent for one query, summed over its round trips.
+
+    Fixtures store a list with one count per model round trip; older
+    fixtures hold a single int. None if any count is missing.
+    """
+    if isinstance(value, list):
+        return None if not value or None in value else sum(value)
+    return value
+
+
+def _estimate_tokens(text: str) -> int:
+    # Rough 4 characters per token; good enough to compare prompt changes
+    return len(text) // 4
+
+
+class MissingRecordingError(Exception):
+    """Raised in replay when the fixture has no response for a query."""
+
+
+class _Usage:
+    def __init__(self, prompt_token_count):
+        self.prompt_token_count = prompt_token_count
+
+
+class _Response:
+    def __init__(self, text, prompt_token_count):
+        self.text = text
+        self.usage_metadata = _Usage(prompt_token_count)
+
+
+class GenAIRecorder:
+    """Wraps google.generativeai and records responses to a fixture file."""
+
+    def __init__(self, fixture_path: str):
+        import google.generativeai as genai
+
+        self._genai = genai
+        self.fixture_path = fixture_path
+        self.responses = {}
+        if os.path.exists(fixture_path):
+            with open(fixture_path) as f:
+                self.responses = json.load(f).get("responses", {})
+
+    def configure(self, **kwargs):
+        self._genai.configure(**kwargs)
+
+    def GenerativeModel(self, model_name=None, tools=None, **kwargs):
+        model = self._genai.GenerativeModel(
+            model_name=model_name, tools=tools, **kwargs
+        )
+        return _RecordingModel(self, model, model_name)
+
+    def save(self):
+        with open(self.fixture_path, "w") as f:
+            json.dump({"responses": self.responses}, f, indent=2)
+
+
+class _RecordingModel:
+    def __init__(self, recorder, model, model_name):
+        self.recorder = recorder
+        self.model = model
+        self.model_name = model_name
+        # Prompt tokens of each generate_content call. Chat sessions call the
+        # model once per round trip (including automatic function calls),
+        # so wrap it here rather than reading the final response only.
+        self.prompt_tokens = []
+        generate_content = model.generate_content
+
+        def recording_generate_content(*args, **kwargs):
+            response = generate_content(*args, **kwargs)
+            usage = getattr(response, "usage_metadata", None)
+            self.prompt_tokens.append(getattr(usage, "prompt_token_count", None))
+            return response
+
+        model.generate_content = recording_generate_content
+
+    def start_chat(self, **kwargs):
+        return _RecordingChat(self, self.model.start_chat(**kwargs))
+
+
+class _RecordingChat:
+    def __init__(self, model, chat):
+        self.model = model
+        self.chat = chat
+
+    def send_message(self, message, **kwargs):
+        seen = len(self.chat.history)
+        self.model.prompt_tokens = []
+        response = self.chat.send_message(message, **kwargs)
+
+        # Automatic function calling leaves its calls in the chat history
+        calls = []
+        for content in self.chat.history[seen:]:
+            for part in content.parts:
+                fc = getattr(part, "function_call", None)
+                if fc and fc.name:
+                    calls.append({"name": fc.name, "args": _to_plain(fc.args)})
+
+        self.model.recorder.responses[_user_query(message)] = {
+            "model": self.model.model_name,
+            "function_calls": calls,
+            "text": response.text,
+            "prompt_tokens": list(self.model.prompt_tokens),
+        }
+        self.model.recorder.save()
+        return response
+
+
+class GenAIReplayer:
+    """Serves recorded responses offline with synthetic latency and 429s.
+
+    Each model round trip (the initial message plus one per recorded
+    function call) sleeps `latency` seconds, plus up to `jitter`. Each
+    send_message fails with a 429 error with probability `error_rate`.
+    Recorded tool calls are re-run against the agent's real tools; calls
+    to tools that no longer exist or no longer accept the recorded
+    arguments are reported in stats["tool_mismatches"].
+    """
+
+    def __init__(
+        self,
+        fixture_path: str,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        with open(fixture_path) as f:
+            self.responses = json.load(f).get("responses", {})
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = {
+            "sends": 0,
+            "errors": 0,
+            "tool_calls": 0,
+            # Recorded prompt_token_count summed over the query's round trips;
+            # falls back to an estimate (and sets tokens_estimated) for
+            # responses recorded without usage data
+            "tokens_sent": 0,
+            "tokens_estimated": False,
+            "missing": 0,
+            # Recorded tool calls the current tools can no longer serve
+            "tool_mismatches": [],
+        }
+
+    def configure(self, **kwargs):
+        pass
+
+    def GenerativeModel(self, model_name=None, tools=None, **kwargs):
+        return _ReplayModel(self, tools or [])
+
+    def _sleep(self, round_trips: int):
+        for _ in range(round_trips):
+            delay = self.latency + self.rng.uniform(0, self.jitter)
+            if delay > 0:
+                time.sleep(delay)
+
+
+class _ReplayModel:
+    def __init__(self, replayer, tools):
+        self.replayer = replayer
+        self.tools = {fn.__name__: fn for fn in tools}
+
+    def start_chat(self, **kwargs):
+        return _ReplayChat(self)
+
+
+class _ReplayChat:
+    def __init__(self, model):
+        self.model = model
+
+    def send_message(self, message, **kwargs):
+        replayer = self.model.replayer
+        stats = replayer.stats
+
+        entry = replayer.responses.get(_user_query(message))
+        if entry is None:
+            # Not a retryable API error: the fixture needs re-recording
+            stats["missing"] += 1
+            raise MissingRecordingError(
+                f"No recorded response for: {_user_query(message)}"
+            )
+
+        stats["sends"] += 1
+        if replayer.rng.random() < replayer.error_rate:
+            replayer._sleep(1)
+            stats["errors"] += 1
+            raise Exception("429 Resource has been exhausted (injected)")
+
+        replayer._sleep(1)
+        for call in entry["function_calls"]:
+            stats["tool_calls"] += 1
+            replayer._sleep(1)
+            fn = self.model.tools.get(call["name"])
+            if fn is None:
+                stats["tool_mismatches"].append(f"{call['name']}: no such tool")
+                continue
+            try:
+                fn(**call["args"])
+            except Exception as e:
+                # e.g. a renamed parameter; the recording no longer applies
+                stats["tool_mismatches"].append(f"{call['name']}: {e}")
+
+        tokens = _recorded_tokens(entry.get("prompt_tokens"))
+        if tokens is not None:
+            stats["tokens_sent"] += tokens
+        else:
+            stats["tokens_sent"] += _estimate_tokens(message)
+            stats["tokens_estimated"] = True
+
+        return _Response(entry["text"], tokens)
@@ -0,0 +1,199 @@
+import pandas as pd
+import itertools
+import os
+from typing import Optional, Dict, Any, List
+from src.logic import RosterManager, FleetManager, ConflictDetector, run_in_pool
+
+# Unique fork ids (unlike id(), never reused after garbage collection)
+_fork_ids = itertools.count()
+
+
+class Scenario:
+    """A what-if fork of the live tables.
+
+    The fork holds references to the base DataFrames and records only its
+    own deltas ({table: {row_id: {column: value}}}). Reads rebuild just the
+    touched columns on top of the base, so the base tables are never copied
+    or modified. Nothing is saved or synced until commit() is called, and
+    commit() refuses to overwrite tables that changed after the fork.
+    """
+
+    def __init__(self, data_handler, name: Optional[str] = None):
+        self.name = name
+        self._handler = data_handler
+        self._keys = data_handler.PRIMARY_KEYS
+        self._fork_id = next(_fork_ids)
+        self._snapshot()
+        self.deltas = {key: {} for key in self._base}
+        # Bumped by every set(), so each edit gets a new view version
+        self._edits = {key: 0 for key in self._base}
+        self._views = {}
+
+    def _snapshot(self):
+        # Table references plus their versions, read together under the lock;
+        # DataHandler replaces frames on write rather than mutating them
+        with self._handler._lock:
+            self._base = dict(self._handler.data)
+            self._base_versions = dict(self._handler.versions)
+
+    # Recording changes
+    def set(self, table: str, row_id: str, **values):
+        """Records new values for one row of the fork."""
+        base = self._base.get(table, pd.DataFrame())
+        pk = self._keys.get(table)
+        if pk not in base.columns or row_id not in base[pk].values:
+            raise ValueError(f"{table}: {row_id} not found.")
+        unknown = [c for c in values if c not in base.columns]
+        if unknown:
+            raise ValueError(f"{table}: unknown columns {', '.join(unknown)}.")
+
+        self.deltas[table].setdefault(row_id, {}).update(values)
+        self._edits[table] += 1
+        self._views.pop(table, None)
+        return self
+
+    def slip_mission(self, project_id: str, days: int):
+        """Shifts a mission's start and end dates by `days`."""
+        missions = self.get_missions()
+        row = missions[missions["project_id"] == project_id]
+        if row.empty:
+            raise ValueError(f"missions: {project_id} not found.")
+
+        shift = pd.Timedelta(days=days)
+        return self.set(
+            "missions",
+            project_id,
+            start_date=(pd.to_datetime(row.iloc[0]["start_date"]) + shift).strftime(
+                "%Y-%m-%d"
+            ),
+            end_date=(pd.to_datetime(row.iloc[0]["end_date"]) + shift).strftime(
+                "%Y-%m-%d"
+            ),
+        )
+
+    # DataHandler-compatible reads, so the managers run against the overlay
+    def _view(self, table: str) -> pd.DataFrame:
+        base = self._base.get(table, pd.DataFrame())
+        delta = self.deltas.get(table)
+        if not delta:
+            return base
+        if table in self._views:
+            return self._views[table]
+
+        # Like the .iloc[0] lookups elsewhere, the first row wins if an id
+        # is duplicated
+        keys = base[self._keys[table]].reset_index(drop=True).drop_duplicates()
+        positions = keys.index[pd.Index(keys).get_indexer(list(delta))]
+        view = base.copy(deep=False)
+
+        # Rebuild only the columns this fork touched
+        columns = {c for values in delta.values() for c in values}
+        for column in columns:
+            col = base[column].copy()
+            for pos, values in zip(positions, delta.values()):
+                if column not in values:
+                    continue
+                try:
+                    col.iloc[pos] = values[column]
+                except (TypeError, ValueError):
+                    col = col.astype(object)
+                    col.iloc[pos] = values[column]
+            view[column] = col
+
+        self._views[table] = view
+        return view
+
+    @property
+    def data(self) -> Dict[str, pd.DataFrame]:
+        return {key: self._view(key) for key in self._base}
+
+    @property
+    def versions(self) -> Dict[str, Any]:
+        # Distinct from the base so memoized views don't mix the two
+        return {
+            key: (self._base_versions.get(key, 0), self._fork_id, self._edits[key])
+            for key in self._base
+        }
+
+    def get_pilots(self):
+        return self._view("pilots")
+
+    def get_drones(self):
+        return self._view("drones")
+
+    def get_missions(self):
+        return self._view("missions")
+
+    # Analysis
+    def evaluate(self) -> Dict[str, Any]:
+        """Runs conflict detection and availability queries on the overlay."""
+        pilots = RosterManager(self).get_available_pilots()
+        drones = FleetManager(self).get_available_drones()
+        return {
+            "name": self.name,
+            "conflicts": ConflictDetector(self).check_all_active_conflicts(),
+            "available_pilots": pilots["pilot_id"].tolist(),
+            "available_drones": drones["drone_id"].tolist(),
+        }
+
+    def changes(self) -> List[Dict[str, Any]]:
+        """The fork's deltas as DataHandler.apply_changes() row changes."""
+        return [
+            {"table": table, "id": row_id, "values": dict(values)}
+            for table, rows in self.deltas.items()
+            for row_id, values in rows.items()
+        ]
+
+    def commit(self, sync: bool = True) -> str:
+        """Applies the fork's deltas to the live tables, saving and syncing.
+
+        Raises ValueError if a table this fork edited has changed since the
+        fork (or the last rebase()), leaving the live data untouched.
+        """
+        return self._handler.apply_changes(
+            self.changes(), sync=sync, base_versions=self._base_versions
+        )
+
+    def rebase(self):
+        """Moves the fork onto the current live tables, keeping its deltas.
+
+        Raises ValueError (leaving the fork as it was) if an edited row no
+        longer exists.
+        """
+        saved = dict(self.__dict__)
+        old_deltas = self.deltas
+        self._snapshot()
+        self.deltas = {key: {} for key in self._base}
+        self._edits = {key: self._edits.get(key, 0) + 1 for key in self._base}
+        self._views = {}
+        try:
+            for table, rows in old_deltas.items():
+                for row_id, values in rows.items():
+                    self.set(table, row_id, **values)
+        except ValueError:
+            self.__dict__.update(saved)
+            raise
+        return self
+
+    def __getstate__(self):
+        # The handler owns the Sheets connector, which can't be pickled;
+        # a pickled scenario can be evaluated but not committed.
+        state = self.__dict__.copy()
+        state["_handler"] = None
+        return state
+
+
+def evaluate_scenarios(
+    scenarios: List[Scenario], workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Evaluates scenarios in a process pool, returning results in order."""
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(scenarios) <= 1:
+        return [s.evaluate() for s in scenarios]
+
+    # Scenarios share base frames, so each worker unpickles them only once
+    return run_in_pool(_evaluate_one, scenarios, range(len(scenarios)), workers)
+
+
+def _evaluate_one(scenarios, index):
+    return scenarios[index].evaluate()
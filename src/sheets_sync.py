@@ -1,42 +1,62 @@
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
 import pandas as pd
+from typing import Optional
+
+# gspread and oauth2client are imported on first use: they are slow to
+# import and only needed once a connector is actually created.
 
 
 class GoogleSheetsConnector:
-    def __init__(self, key_file: str):
+    def __init__(self, key_file: Optional[str] = None, client=None):
         self.scope = [
             "https://spreadsheets.google.com/feeds",
             "https://www.googleapis.com/auth/drive",
         ]
+
+        # An already-authorized (or fake) gspread client can be passed in
+        if client is not None:
+            self.client = client
+            return
+
+        import gspread
+        from oauth2client.service_account import ServiceAccountCredentials
+
         self.creds = ServiceAccountCredentials.from_json_keyfile_name(
             key_file, self.scope
         )
         self.client = gspread.authorize(self.creds)
 
+    def _open(self, sheet_id_or_name: str):
+        """Opens a spreadsheet by key (ID) first, then by title."""
+        import gspread
+
+        try:
+            return self.client.open_by_key(sheet_id_or_name)
+        except gspread.exceptions.APIError:
+            # If ID fails (e.g. it's a name), try open by title
+            return self.client.open(sheet_id_or_name)
+
     def read_sheet(self, sheet_id_or_name: str) -> pd.DataFrame:
         """Reads a Google Sheet by ID or Name into a DataFrame."""
         try:
-            # Try opening by key (ID) first, then by title
-            try:
-                sheet = self.client.open_by_key(sheet_id_or_name).sheet1
-            except gspread.exceptions.APIError:
-                # If ID fails (e.g. it's a name), try open by title
-                sheet = self.client.open(sheet_id_or_name).sheet1
-
+            sheet = self._open(sheet_id_or_name).sheet1
             data = sheet.get_all_records()
             return pd.DataFrame(data)
         except Exception as e:
             print(f"Error loading sheet {sheet_id_or_name}: {e}")
             return pd.DataFrame()
 
+    def get_revision(self, sheet_id_or_name: str) -> Optional[str]:
+        """Returns the spreadsheet's last modified time, or None if unknown."""
+        try:
+            return self._open(sheet_id_or_name).get_lastUpdateTime()
+        except Exception:
+            # Drive metadata may be unavailable; callers then read the sheet
+            return None
+
     def update_sheet(self, sheet_id_or_name: str, df: pd.DataFrame):
         """Overwrites a Google Sheet with the provided DataFrame."""
         try:
-            try:
-                sheet = self.client.open_by_key(sheet_id_or_name).sheet1
-            except gspread.exceptions.APIError:
-                sheet = self.client.open(sheet_id_or_name).sheet1
+            sheet = self._open(sheet_id_or_name).sheet1
 
             # Clear existing data
             sheet.clear()
@@ -25,3 +25,25 @@ def calculate_duration(start_date, end_date):
     if start and end:
         return (end - start).days + 1  # Inclusive
     return 0
+
+
+def canonical_value(value) -> str:
+    """Text form of a cell that agrees between CSV and Sheets reads.
+
+    A CSV numeric column with a blank cell loads as floats ("1500.0"),
+    while gspread returns 1500, so integral floats are written as ints
+    and empty cells as "".
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def fingerprint_rows(df: pd.DataFrame, key_column: str) -> pd.Series:
+    """Hashes each row's values into a Series indexed by the key column."""
+    cols = sorted(df.columns)
+    values = df[cols].apply(lambda col: col.map(canonical_value))
+    hashes = pd.util.hash_pandas_object(values, index=False)
+    return pd.Series(hashes.values, index=df[key_column].map(canonical_value).values)
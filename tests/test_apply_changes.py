@@ -0,0 +1,161 @@
+import pandas as pd
+import pytest
+
+from src.agent import DroneAgent
+from src.data_handler import DataHandler
+
+PILOTS = [
+    {"pilot_id": "P001", "location": "Bangalore", "status": "Available", "rate": 1500},
+    {"pilot_id": "P002", "location": "Mumbai", "status": "Assigned", "rate": 3000},
+]
+DRONES = [
+    {"drone_id": "D001", "location": "Bangalore", "status": "Available"},
+    {"drone_id": "D002", "location": "Mumbai", "status": "Maintenance"},
+    {"drone_id": "D003", "location": "Mumbai", "status": "Available"},
+    {"drone_id": "D004", "location": " mumbai", "status": "Deployed"},
+]
+
+
+@pytest.fixture
+def dh(tmp_path, monkeypatch):
+    for var in ("PILOT_SHEET_ID", "DRONE_SHEET_ID", "MISSIONS_SHEET_ID"):
+        monkeypatch.delenv(var, raising=False)
+
+    pilot_file = tmp_path / "pilots.csv"
+    drone_file = tmp_path / "drones.csv"
+    pd.DataFrame(PILOTS).to_csv(pilot_file, index=False)
+    pd.DataFrame(DRONES).to_csv(drone_file, index=False)
+    return DataHandler(
+        pilot_file=str(pilot_file),
+        drone_file=str(drone_file),
+        mission_file=str(tmp_path / "missions.csv"),
+        warm_in_background=False,
+    )
+
+
+def snapshot(dh):
+    """Tables in memory and on disk, for before/after comparisons."""
+    return {
+        key: (dh.data[key].copy(), pd.read_csv(dh.files[key]))
+        for key in ("pilots", "drones")
+    }
+
+
+def assert_unchanged(dh, before):
+    for key, (memory, disk) in before.items():
+        pd.testing.assert_frame_equal(dh.data[key], memory)
+        pd.testing.assert_frame_equal(pd.read_csv(dh.files[key]), disk)
+
+
+def test_invalid_second_change_leaves_both_tables_unchanged(dh):
+    before = snapshot(dh)
+    changes = [
+        {"table": "drones", "id": "D001", "values": {"status": "Maintenance"}},
+        {"table": "pilots", "id": "P999", "values": {"status": "On Leave"}},
+    ]
+
+    with pytest.raises(ValueError, match="P999 not found"):
+        dh.apply_changes(changes, sync=False)
+    assert_unchanged(dh, before)
+
+
+def test_dtype_error_rolls_back_earlier_changes(dh):
+    before = snapshot(dh)
+    changes = [
+        {"table": "drones", "id": "D001", "values": {"status": "Maintenance"}},
+        {"table": "pilots", "id": "P001", "values": {"rate": "a lot"}},
+    ]
+
+    with pytest.raises(ValueError, match="rolled back"):
+        dh.apply_changes(changes, sync=False)
+    assert_unchanged(dh, before)
+
+
+def test_failed_save_restores_csvs_already_written(dh, tmp_path):
+    before = snapshot(dh)
+    pilot_file = dh.files["pilots"]
+    # Drones are saved first; the pilots CSV can't be written
+    dh.files["pilots"] = str(tmp_path)
+    changes = [
+        {"table": "drones", "id": "D001", "values": {"status": "Maintenance"}},
+        {"table": "pilots", "id": "P001", "values": {"status": "On Leave"}},
+    ]
+
+    with pytest.raises(ValueError, match="rolled back"):
+        dh.apply_changes(changes, sync=False)
+    dh.files["pilots"] = pilot_file
+    assert_unchanged(dh, before)
+
+
+def test_malformed_change_is_rejected_before_version_check(dh):
+    with pytest.raises(ValueError, match="Unknown table"):
+        dh.apply_changes(
+            [
+                {"table": "drones", "id": "D001", "values": {"status": "Deployed"}},
+                {"id": "D002", "values": {"status": "Available"}},
+            ],
+            sync=False,
+            base_versions=dict(dh.versions),
+        )
+
+
+class FakeGenAI:
+    """Captures the tools DroneAgent hands to the model."""
+
+    def __init__(self):
+        self.tools = {}
+
+    def configure(self, **kwargs):
+        pass
+
+    def GenerativeModel(self, model_name=None, tools=None, **kwargs):
+        self.tools = {fn.__name__: fn for fn in tools}
+        return self
+
+    def start_chat(self, **kwargs):
+        return self
+
+    def send_message(self, message, **kwargs):
+        return self
+
+
+@pytest.fixture
+def bulk_update_status(dh):
+    genai = FakeGenAI()
+    DroneAgent(dh, "test-key", genai_client=genai).process_query("hi")
+    return genai.tools["bulk_update_status"]
+
+
+def statuses(dh):
+    drones = dh.get_drones()
+    return dict(zip(drones["drone_id"], drones["status"]))
+
+
+def test_bulk_update_selects_by_location(dh, bulk_update_status):
+    result = bulk_update_status("drones", "Maintenance", location="MUMBAI")
+
+    assert result.startswith("Updated 3 drones (D002, D003, D004)")
+    assert statuses(dh) == {
+        "D001": "Available",
+        "D002": "Maintenance",
+        "D003": "Maintenance",
+        "D004": "Maintenance",
+    }
+
+
+def test_bulk_update_combines_location_and_current_status(dh, bulk_update_status):
+    result = bulk_update_status(
+        "drones", "Maintenance", location="Mumbai", current_status="deployed"
+    )
+
+    assert result.startswith("Updated 1 drones (D004)")
+    assert statuses(dh)["D003"] == "Available"
+
+
+def test_bulk_update_without_matches_changes_nothing(dh, bulk_update_status):
+    version = dh.versions["drones"]
+
+    result = bulk_update_status("drones", "Maintenance", location="Delhi")
+
+    assert result.startswith("No drones matched")
+    assert dh.versions["drones"] == version
@@ -0,0 +1,85 @@
+import pandas as pd
+import pytest
+
+from src.data_handler import DataHandler
+from src.logic import ConflictDetector, shard_assignments
+
+LOCATIONS = ["Bangalore", "Mumbai", "Delhi", "Pune", "Chennai"]
+
+
+def roster(n=40):
+    pilots, drones, missions = [], [], []
+    for i in range(n):
+        location = LOCATIONS[i % len(LOCATIONS)]
+        mission_id = f"PRJ{i:03d}"
+        pilots.append(
+            {
+                "pilot_id": f"P{i:03d}",
+                "name": f"Pilot {i}",
+                "certifications": "DGCA" if i % 3 else "None",
+                "location": location,
+                "current_assignment": mission_id if i % 4 else "-",
+                "daily_rate_inr": 1500 * (1 + i % 3),
+            }
+        )
+        # Every seventh mission has no drone, every eleventh no mission row
+        if i % 7:
+            drones.append({"drone_id": f"D{i:03d}", "current_assignment": mission_id})
+        if i % 11:
+            missions.append(
+                {
+                    "project_id": mission_id,
+                    "required_certs": "DGCA",
+                    "start_date": "2026-02-06",
+                    "end_date": f"2026-02-{7 + i % 5:02d}",
+                    "mission_budget_inr": 6000,
+                }
+            )
+    return pilots, drones, missions
+
+
+@pytest.fixture
+def dh(tmp_path, monkeypatch):
+    for var in ("PILOT_SHEET_ID", "DRONE_SHEET_ID", "MISSIONS_SHEET_ID"):
+        monkeypatch.delenv(var, raising=False)
+
+    files = {}
+    for name, rows in zip(("pilots", "drones", "missions"), roster()):
+        files[name] = str(tmp_path / f"{name}.csv")
+        pd.DataFrame(rows).to_csv(files[name], index=False)
+    return DataHandler(
+        pilot_file=files["pilots"],
+        drone_file=files["drones"],
+        mission_file=files["missions"],
+        warm_in_background=False,
+    )
+
+
+@pytest.mark.parametrize("shard_by", ["location", "mission"])
+def test_parallel_matches_serial(dh, shard_by):
+    detector = ConflictDetector(dh)
+    serial = detector.check_all_active_conflicts()
+
+    assert any("Conflict" in issue for issue in serial)
+    assert any("no Drone assigned" in issue for issue in serial)
+    assert any("not found" in issue for issue in serial)
+    assert (
+        detector.check_all_active_conflicts_parallel(shard_by=shard_by, workers=3)
+        == serial
+    )
+
+
+@pytest.mark.parametrize("shard_by", ["location", "mission"])
+@pytest.mark.parametrize("num_shards", [2, 3, 4, 7])
+def test_shard_sizes_differ_by_at_most_one(dh, shard_by, num_shards):
+    pilots = dh.get_pilots()
+    shards = shard_assignments(pilots, shard_by=shard_by, num_shards=num_shards)
+    sizes = [len(shard) for shard in shards]
+
+    assert len(shards) == num_shards
+    assert max(sizes) - min(sizes) <= 1
+    assigned = (pilots["current_assignment"] != "-").sum()
+    assert sorted(p for shard in shards for p in shard) == list(
+        pilots.index[pilots["current_assignment"] != "-"]
+    )
+    assert sum(sizes) == assigned
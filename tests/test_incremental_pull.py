@@ -0,0 +1,209 @@
+import time
+
+import pandas as pd
+import pytest
+
+from src.data_handler import DataHandler
+from src.sheets_sync import GoogleSheetsConnector
+
+PILOTS = [
+    {"pilot_id": "P001", "name": "Arjun", "status": "Available", "rate": 1500},
+    {"pilot_id": "P002", "name": "Neha", "status": "Assigned", "rate": 3000},
+    {"pilot_id": "P003", "name": "Rohit", "status": "Available", "rate": 1500},
+]
+
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+
+    def get_all_records(self):
+        self.spreadsheet.reads += 1
+        return [dict(r) for r in self.spreadsheet.records]
+
+
+class FakeSpreadsheet:
+    def __init__(self, records, revision):
+        self.records = records
+        self.revision = revision
+        self.reads = 0
+        self.sheet1 = FakeWorksheet(self)
+
+    def get_lastUpdateTime(self):
+        return self.revision
+
+
+class FakeClient:
+    """Just enough of gspread.Client for GoogleSheetsConnector."""
+
+    def __init__(self):
+        self.spreadsheets = {}
+
+    def open_by_key(self, key):
+        return self.spreadsheets[key]
+
+    def open(self, title):
+        return self.spreadsheets[title]
+
+
+@pytest.fixture
+def handler(tmp_path, monkeypatch):
+    for var in ("PILOT_SHEET_ID", "DRONE_SHEET_ID", "MISSIONS_SHEET_ID"):
+        monkeypatch.delenv(var, raising=False)
+
+    pilot_file = tmp_path / "pilots.csv"
+    pd.DataFrame(PILOTS).to_csv(pilot_file, index=False)
+
+    dh = DataHandler(
+        pilot_file=str(pilot_file),
+        drone_file=str(tmp_path / "drones.csv"),
+        mission_file=str(tmp_path / "missions.csv"),
+        sheet_mapping={"pilots": "Pilot Roster"},
+        warm_in_background=False,
+    )
+    client = FakeClient()
+    dh.connector = GoogleSheetsConnector(client=client)
+    return dh, client
+
+
+def publish(client, records, revision="r1"):
+    client.spreadsheets["Pilot Roster"] = FakeSpreadsheet(records, revision)
+    return client.spreadsheets["Pilot Roster"]
+
+
+def test_applies_inserts_updates_and_deletes(handler):
+    dh, client = handler
+    remote = [dict(r) for r in PILOTS[:2]]
+    remote[1]["status"] = "On Leave"
+    remote.append(
+        {"pilot_id": "P004", "name": "Sneha", "status": "Available", "rate": 5000}
+    )
+    publish(client, remote)
+
+    change = dh.sync_from_sheets_incremental()["pilots"]
+
+    assert change["inserted"] == ["P004"]
+    assert change["updated"] == ["P002"]
+    assert change["deleted"] == ["P003"]
+    assert change["error"] is None
+    pilots = dh.get_pilots()
+    assert pilots["pilot_id"].tolist() == ["P001", "P002", "P004"]
+    assert pilots.loc[1, "status"] == "On Leave"
+    assert pd.read_csv(dh.files["pilots"])["pilot_id"].tolist() == [
+        "P001",
+        "P002",
+        "P004",
+    ]
+
+
+def test_unchanged_rows_are_not_rewritten(handler):
+    dh, client = handler
+    publish(client, PILOTS)
+    version = dh.versions["pilots"]
+
+    change = dh.sync_from_sheets_incremental()["pilots"]
+
+    assert change["inserted"] == change["updated"] == change["deleted"] == []
+    assert change["replaced"] is False
+    assert dh.versions["pilots"] == version
+
+
+def test_skips_sheet_when_revision_unchanged(handler):
+    dh, client = handler
+    sheet = publish(client, PILOTS, revision="r1")
+    dh.sync_from_sheets_incremental()
+    assert sheet.reads == 1
+
+    change = dh.sync_from_sheets_incremental()["pilots"]
+
+    assert change["skipped"] is True
+    assert sheet.reads == 1
+
+    sheet.revision = "r2"
+    assert dh.sync_from_sheets_incremental()["pilots"]["skipped"] is False
+    assert sheet.reads == 2
+
+
+def test_schema_change_replaces_table(handler):
+    dh, client = handler
+    # "status" renamed to "base" in the sheet; P003 dropped, P004 added
+    remote = [
+        {"pilot_id": r["pilot_id"], "name": r["name"], "base": "HQ", "rate": r["rate"]}
+        for r in PILOTS[:2]
+    ]
+    remote.append({"pilot_id": "P004", "name": "Sneha", "base": "HQ", "rate": 5000})
+    publish(client, remote)
+
+    change = dh.sync_from_sheets_incremental()["pilots"]
+
+    assert change["replaced"] is True
+    assert change["inserted"] == ["P004"]
+    assert change["deleted"] == ["P003"]
+    assert "base" in dh.get_pilots().columns
+    assert "status" not in dh.get_pilots().columns
+
+
+def test_blank_numeric_cell_does_not_mark_rows_updated(handler):
+    dh, client = handler
+    # One blank rate makes the local CSV column float (1500.0)
+    local = pd.DataFrame(PILOTS)
+    local["rate"] = local["rate"].astype(float)
+    local.loc[0, "rate"] = None
+    dh.update_pilots(local)
+
+    remote = [dict(r) for r in PILOTS]
+    remote[0]["rate"] = ""
+    publish(client, remote)
+
+    change = dh.sync_from_sheets_incremental()["pilots"]
+
+    assert change["updated"] == []
+
+
+def test_duplicate_local_ids_are_collapsed_and_reported(handler):
+    dh, client = handler
+    dh.update_pilots(pd.DataFrame(PILOTS + [dict(PILOTS[0], status="On Leave")]))
+    publish(client, PILOTS)
+
+    change = dh.sync_from_sheets_incremental()["pilots"]
+
+    assert change["error"] is None
+    assert change["duplicates"] == ["P001"]
+    assert change["updated"] == ["P001"]
+    assert sorted(dh.get_pilots()["pilot_id"]) == ["P001", "P002", "P003"]
+
+
+def test_public_pull_keeps_edits_made_during_fetch(handler, monkeypatch):
+    dh, _ = handler
+    dh.sheet_ids = {"pilots": "public-sheet"}
+    remote = pd.DataFrame(PILOTS)
+
+    def slow_read_csv(url, *args, **kwargs):
+        if "public-sheet" not in str(url):
+            return real_read_csv(url, *args, **kwargs)
+        # An operator edit lands while the sheet is downloading
+        change = {"table": "pilots", "id": "P001", "values": {"status": "On Leave"}}
+        dh.apply_changes([change], sync=False)
+        return remote
+
+    real_read_csv = pd.read_csv
+    monkeypatch.setattr(pd, "read_csv", slow_read_csv)
+
+    dh.sync_from_public_sheets()
+
+    pilots = dh.get_pilots()
+    assert pilots.loc[pilots["pilot_id"] == "P001", "status"].iloc[0] == "On Leave"
+
+
+def test_background_refresh_respects_max_age(handler):
+    dh, client = handler
+    sheet = publish(client, PILOTS)
+
+    assert dh.refresh_in_background(max_age=3600) is False
+    assert dh.refresh_in_background(max_age=0) is True
+
+    deadline = time.monotonic() + 5
+    while dh._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sheet.reads == 1
+    assert dh.refresh_in_background(max_age=3600) is False
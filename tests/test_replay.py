@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+from src.replay import GenAIReplayer
+
+QUERY = "System: prompt\nUser: Check for any active conflicts"
+
+
+@pytest.mark.parametrize(
+    "prompt_tokens, sent, estimated",
+    [
+        ([1200, 1350, 1500], 4050, False),  # one count per round trip
+        (1500, 1500, False),  # fixtures recorded before per-round-trip usage
+        ([1200, None], len(QUERY) // 4, True),
+        (None, len(QUERY) // 4, True),
+    ],
+)
+def test_replay_sums_prompt_tokens(tmp_path, prompt_tokens, sent, estimated):
+    fixture = tmp_path / "fixture.json"
+    entry = {"function_calls": [], "text": "ok", "prompt_tokens": prompt_tokens}
+    fixture.write_text(
+        json.dumps({"responses": {"Check for any active conflicts": entry}})
+    )
+    replayer = GenAIReplayer(str(fixture))
+
+    replayer.GenerativeModel().start_chat().send_message(QUERY)
+
+    assert replayer.stats["tokens_sent"] == sent
+    assert replayer.stats["tokens_estimated"] is estimated
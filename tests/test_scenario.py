@@ -0,0 +1,72 @@
+import pandas as pd
+import pytest
+
+from src.data_handler import DataHandler
+from src.logic import TableQuery
+
+DRONES = [
+    {"drone_id": "D001", "location": "Bangalore", "status": "Available"},
+    {"drone_id": "D003", "location": "Mumbai", "status": "Available"},
+]
+
+
+@pytest.fixture
+def dh(tmp_path, monkeypatch):
+    for var in ("PILOT_SHEET_ID", "DRONE_SHEET_ID", "MISSIONS_SHEET_ID"):
+        monkeypatch.delenv(var, raising=False)
+
+    drone_file = tmp_path / "drones.csv"
+    pd.DataFrame(DRONES).to_csv(drone_file, index=False)
+    return DataHandler(
+        pilot_file=str(tmp_path / "pilots.csv"),
+        drone_file=str(drone_file),
+        mission_file=str(tmp_path / "missions.csv"),
+        warm_in_background=False,
+    )
+
+
+def drone_status(dh, drone_id):
+    drones = dh.get_drones()
+    return drones.loc[drones["drone_id"] == drone_id, "status"].iloc[0]
+
+
+def test_fork_does_not_touch_live_tables(dh):
+    scenario = dh.fork_scenario().set("drones", "D003", status="Maintenance")
+
+    assert drone_status(scenario, "D003") == "Maintenance"
+    assert drone_status(dh, "D003") == "Available"
+
+
+def test_commit_refuses_stale_fork(dh):
+    scenario = dh.fork_scenario()
+    change = {"table": "drones", "id": "D003", "values": {"status": "Deployed"}}
+    dh.apply_changes([change], sync=False)
+
+    scenario.set("drones", "D003", status="Maintenance")
+    with pytest.raises(ValueError):
+        scenario.commit(sync=False)
+    assert drone_status(dh, "D003") == "Deployed"
+
+    scenario.rebase().commit(sync=False)
+    assert drone_status(dh, "D003") == "Maintenance"
+
+
+def test_repeated_set_invalidates_memoized_queries(dh):
+    scenario = dh.fork_scenario()
+    query = TableQuery(scenario)
+
+    scenario.set("drones", "D003", status="Maintenance")
+    rows, _ = query.page("drones", status="Maintenance")
+    assert rows["drone_id"].tolist() == ["D003"]
+
+    scenario.set("drones", "D003", status="Deployed")
+    rows, _ = query.page("drones", status="Maintenance")
+    assert rows.empty
+
+
+def test_fork_reads_with_duplicate_ids(dh):
+    dh.update_drones(pd.DataFrame(DRONES + [dict(DRONES[1], status="Deployed")]))
+    scenario = dh.fork_scenario().set("drones", "D003", status="Maintenance")
+
+    drones = scenario.get_drones()
+    assert drones["status"].tolist() == ["Available", "Maintenance", "Deployed"]
@@ -0,0 +1,92 @@
+import pandas as pd
+import pytest
+
+from src.data_handler import DataHandler
+from src.logic import TableQuery
+
+PILOTS = [
+    {
+        "pilot_id": f"P{i:03d}",
+        "skills": "Mapping, Survey" if i % 2 else "Inspection",
+        "location": ["Bangalore", " mumbai", "Mumbai"][i % 3],
+        "status": "Available" if i % 4 else "On Leave",
+        "available_from": f"2026-02-{1 + i:02d}",
+        "daily_rate_inr": 1000 + 100 * (i % 5),
+    }
+    for i in range(12)
+]
+
+
+@pytest.fixture
+def dh(tmp_path, monkeypatch):
+    for var in ("PILOT_SHEET_ID", "DRONE_SHEET_ID", "MISSIONS_SHEET_ID"):
+        monkeypatch.delenv(var, raising=False)
+
+    pilot_file = tmp_path / "pilots.csv"
+    pd.DataFrame(PILOTS).to_csv(pilot_file, index=False)
+    return DataHandler(
+        pilot_file=str(pilot_file),
+        drone_file=str(tmp_path / "drones.csv"),
+        mission_file=str(tmp_path / "missions.csv"),
+        warm_in_background=False,
+    )
+
+
+def ids(rows):
+    return rows["pilot_id"].tolist()
+
+
+def test_filters_combine(dh):
+    query = TableQuery(dh)
+
+    rows, total = query.page(
+        "pilots",
+        status="Available",
+        location="MUMBAI",
+        skill="survey",
+        date_from="2026-02-03",
+        date_to="2026-02-10",
+    )
+
+    assert ids(rows) == ["P005", "P007"]
+    assert total == 2
+    assert query.count("pilots", location="mumbai") == 8
+
+
+def test_pages_and_clamps_page_number(dh):
+    query = TableQuery(dh)
+
+    rows, total = query.page("pilots", page=2, page_size=5)
+    assert ids(rows) == ["P005", "P006", "P007", "P008", "P009"]
+    assert total == 12
+    assert query.page_count(total, 5) == 3
+    assert query.page_count(0, 5) == 1
+
+    assert ids(query.page("pilots", page=99, page_size=5)[0]) == ["P010", "P011"]
+    assert ids(query.page("pilots", page=0, page_size=5)[0])[0] == "P000"
+
+
+def test_sorts_mixed_type_columns(dh):
+    pilots = dh.get_pilots().copy()
+    pilots["daily_rate_inr"] = pilots["daily_rate_inr"].astype(object)
+    pilots.loc[0, "daily_rate_inr"] = "TBD"
+    pilots.loc[1, "daily_rate_inr"] = None
+    dh.update_pilots(pilots)
+
+    rows, _ = TableQuery(dh).page("pilots", sort_by="daily_rate_inr", page_size=20)
+
+    assert rows["daily_rate_inr"].iloc[-1] is None
+    assert len(rows) == 12
+
+
+def test_memo_is_invalidated_by_changes(dh):
+    query = TableQuery(dh)
+    first, _ = query.page("pilots", status="On Leave")
+    assert query.page("pilots", status="On Leave")[0] is first
+
+    change = {"table": "pilots", "id": "P001", "values": {"status": "On Leave"}}
+    dh.apply_changes([change], sync=False)
+
+    rows, total = query.page("pilots", status="On Leave")
+    assert ids(rows) == ["P000", "P001", "P004", "P008"]
+    assert total == 4